@@ -1,26 +1,11 @@
 import sys
-import random
+from wordlists import load_words, load_boards, board_words
 
-def process_input(input):
-    for i in range(len(input)-1): # -1 because the last character doesn't have a \n
-        input[i] = input[i][:-1] # cuts off newline character
-    return input
-
-def read_file(filename):
-    with open(filename) as f:
-        content = f.readlines()
-    return process_input(content)
-
-def process_words(words, letters):
-    new_words = []
-    for word in words:
-        skip = False
-        for c in letters:
-            if c not in word:
-                skip = True
-                break
-        if not skip: new_words.append(word)
-    return new_words
+def process_words(words, letter_boards, letters):
+    matching = (1 << len(words)) - 1
+    for c in letters:
+        matching &= letter_boards.get(c, 0)
+    return board_words(words, matching, len(words))
 
 def word_with(m):
     letters = set()
@@ -35,18 +20,13 @@ def word_with(m):
 
 
 # read in the wordlists
-answers = read_file("wordle-answers-alphabetical.txt")
-allowed = read_file("wordle-allowed-guesses.txt")
-#print(len(answers))
-#print(len(allowed))
-answers.extend(allowed)
-words = answers
-random.shuffle(words)
+words = load_words()
+letter_boards, _ = load_boards()
 
 print("CTRL c should abort this program for you")
 while True:
     letters = word_with(False)
-    matching_words = process_words(words, letters)
+    matching_words = process_words(words, letter_boards, letters)
     print("There are " + str(len(matching_words)) + " that contain those letters!")
     print(matching_words)
 
@@ -1,39 +1,17 @@
 import sys
-import random
-
-def process_input(input):
-    for i in range(len(input)-1): # -1 because the last character doesn't have a \n
-        input[i] = input[i][:-1] # cuts off newline character
-    return input
-
-def read_file(filename):
-    with open(filename) as f:
-        content = f.readlines()
-    return process_input(content)
-
-def process_words(words, positions, unused, wrong_spots):
-    new_words = []
-    for word in words:
-        skip = False
-        for i, c in enumerate(positions):
-            if c != '.' and word[i] != c:
-                skip = True
-                break
-        if skip: continue
-        for c in word:
-            if c in unused:
-                skip = True
-                break
-        if skip: continue
-        for c in wrong_spots:
-            skip = c not in word
-            for i in wrong_spots[c]:
-                if word[i-1] == c:
-                    skip = True
-            if skip: break
-        if skip: continue
-        new_words.append(word)
-    return new_words
+from wordlists import load_words, load_boards, board_words
+
+def process_words(candidates, letter_boards, position_boards, positions, unused, wrong_spots):
+    for c in unused:
+        candidates &= ~letter_boards.get(c, 0)
+    for c in wrong_spots:
+        candidates &= letter_boards.get(c, 0)
+        for i in wrong_spots[c]:
+            candidates &= ~position_boards[i-1].get(c, 0)
+    for i, c in enumerate(positions):
+        if c != '.':
+            candidates &= position_boards[i].get(c, 0)
+    return candidates
 
 def play_round(positions, unused, m):
 
@@ -78,11 +56,11 @@ def play_round(positions, unused, m):
     print("Letters that are in the word and the positions they can not be in:\n" + str(wrong_spots) + "\n")
     return wrong_spots
 
-def is_end(words):
-    if len(words) == 1:
+def is_end(n_left):
+    if n_left == 1:
         print("Congratulations! It looks like you won!")
         return True
-    if len(words) < 1:
+    if n_left < 1:
         print("Uh oh, looks like maybe you input something wrong?")
         print("Try running the program again")
         print("If you think it's a bug, let John know!")
@@ -92,13 +70,8 @@ def is_end(words):
 
 
 # read in the wordlists
-answers = read_file("wordle-answers-alphabetical.txt")
-allowed = read_file("wordle-allowed-guesses.txt")
-#print(len(answers))
-#print(len(allowed))
-answers.extend(allowed)
-words = answers
-random.shuffle(words)
+words = load_words()
+letter_boards, position_boards = load_boards()
 
 
 print("CTRL c should abort this program for you")
@@ -113,17 +86,20 @@ print("Good Luck!\n")
 
 positions = ['.' for i in range(5)]
 unused = set()
+candidates = (1 << len(words)) - 1
+n_left = len(words)
 # The loop only iterates 6 times because it can't help you after your last guess
 for i in range(1, 6):
-    if is_end(words):
+    if is_end(n_left):
         break
     print("After guess " + str(i))
     wrong_spots = play_round(positions, unused, m)
-    words = process_words(words, positions, unused, wrong_spots)
+    candidates = process_words(candidates, letter_boards, position_boards, positions, unused, wrong_spots)
+    n_left = bin(candidates).count('1')
     print("Note: The optimal next guess may not be one of the remaining possible words")
-    print("There are only " + str(len(words)) + " possible words left!")
+    print("There are only " + str(n_left) + " possible words left!")
     n_show = 50
-    print("The first " + str(min(n_show, len(words))) + " are:")
-    print(words[:n_show], end="\n\n")
+    print("The first " + str(min(n_show, n_left)) + " are:")
+    print(board_words(words, candidates, n_show), end="\n\n")
 
 
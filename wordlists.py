@@ -0,0 +1,47 @@
+from functools import lru_cache
+from string import ascii_lowercase
+
+def read_file(filename):
+    with open(filename) as f:
+        return f.read().splitlines()
+
+@lru_cache(maxsize=None)
+def load_words():
+    # answers first, so anything listed in word order shows likely answers before other guesses
+    answers = read_file("wordle-answers-alphabetical.txt")
+    allowed = read_file("wordle-allowed-guesses.txt")
+    return tuple(answers + allowed)
+
+# one_hot[c] turns a string of letters into a string of bits: '1' where the letter is c
+one_hot = {c: str.maketrans(ascii_lowercase, ''.join('1' if x == c else '0' for x in ascii_lowercase))
+           for c in ascii_lowercase}
+
+def build_boards(words):
+    # A board is an int with bit k set when words[k] has some property, so one & or &~
+    # applies a constraint to the whole word list at once.
+    # position_boards[i][c]: words with c at position i, letter_boards[c]: words containing c
+    # Both are keyed by lowercase letter only; callers look up user input with .get(c, 0),
+    # so any other character gets an empty board, as nothing else is in the word lists.
+    position_boards = []
+    for i in range(5):
+        column = ''.join(word[i] for word in reversed(words)) # reversed so words[0] is bit 0
+        position_boards.append({c: int(column.translate(one_hot[c]), 2) for c in ascii_lowercase})
+    letter_boards = {c: 0 for c in ascii_lowercase}
+    for c in ascii_lowercase:
+        for boards in position_boards:
+            letter_boards[c] |= boards[c]
+    return letter_boards, position_boards
+
+def board_words(words, board, n):
+    # the first n words whose bits are set in the board
+    bits = format(board, 'b')[::-1]
+    found = []
+    k = bits.find('1')
+    while k != -1 and len(found) < n:
+        found.append(words[k])
+        k = bits.find('1', k + 1)
+    return found
+
+@lru_cache(maxsize=None)
+def load_boards():
+    return build_boards(load_words())